@@ -2,20 +2,55 @@
 
 import os
 import sys
+from collections.abc import Callable
+from typing import Any
 
 from firebase_functions import https_fn
 
 # Add the src directory to the Python path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+_SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
 
-from app.main import create_app
+# The Flask app is created on the first request rather than at import time so
+# that cold starts don't pay for importing the full application graph.
+_flask_app = None
 
-# Create the Flask app
-flask_app = create_app()
+
+def _get_app():
+    """Return the Flask app, creating it on first use."""
+    global _flask_app  # noqa: PLW0603
+    if _flask_app is None:
+        from app.main import create_app  # noqa: PLC0415
+
+        _flask_app = create_app()
+    return _flask_app
 
 
 @https_fn.on_request()
 def api(req: https_fn.Request) -> https_fn.Response:
     """Cloud Function that serves the Flask app."""
-    with flask_app.request_context(req.environ):
-        return flask_app.full_dispatch_request()
+    # wsgi_app pushes its own request context and runs the full dispatch, so
+    # hand it the environ directly instead of wrapping it in a second context.
+    status: list[str] = []
+    headers: list[tuple[str, str]] = []
+    # Bytes passed to the write() callable come before the returned iterable
+    chunks: list[bytes] = []
+
+    def start_response(
+        status_line: str,
+        response_headers: list[tuple[str, str]],
+        exc_info: Any = None,  # noqa: ARG001
+    ) -> Callable[[bytes], object]:
+        # A second call (after an error) replaces the status and headers
+        status[:] = [status_line]
+        headers[:] = response_headers
+        return chunks.append
+
+    app_iter = _get_app().wsgi_app(req.environ, start_response)
+    try:
+        chunks.extend(app_iter)
+    finally:
+        if hasattr(app_iter, "close"):
+            app_iter.close()
+    return https_fn.Response(b"".join(chunks), status=status[0], headers=headers)
@@ -5,7 +5,7 @@ echo "🚀 Starting Codebase Tutor development environment..."
 
 # Start backend API
 echo "📦 Starting Python backend..."
-cd src && python -m app.main &
+python -m src.app.main &
 BACKEND_PID=$!
 
 # Start React web app
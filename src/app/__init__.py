@@ -1,7 +1,31 @@
 """Codebase Tutor - AI-powered codebase tutor for learning and understanding code."""
 
-from app.__about__ import __version__
-from app.config import Config
-from app.daemon import FlowDaemon
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.__about__ import __version__
+    from app.config import Config
+    from app.daemon import FlowDaemon
 
 __all__ = ["Config", "FlowDaemon", "__version__"]
+
+# Public attributes are imported on first access (PEP 562) so importing the
+# package doesn't pull in config and daemon machinery until it's needed.
+_LAZY_ATTRIBUTES = {
+    "Config": "app.config",
+    "FlowDaemon": "app.daemon",
+    "__version__": "app.__about__",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public attribute on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
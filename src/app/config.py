@@ -2,7 +2,40 @@
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, overload
+
+# Environment variables don't change during normal operation, so each one is
+# read from os.environ at most once per process.
+_ENV_CACHE: dict[str, str | None] = {}
+
+
+@overload
+def _env(name: str) -> str | None: ...
+
+
+@overload
+def _env(name: str, default: str) -> str: ...
+
+
+def _env(name: str, default: str | None = None) -> str | None:
+    """Get an environment variable, caching the lookup."""
+    if name not in _ENV_CACHE:
+        _ENV_CACHE[name] = os.environ.get(name)
+    value = _ENV_CACHE[name]
+    return default if value is None else value
+
+
+def clear_env_cache() -> None:
+    """Forget cached environment variables so they are re-read on next use."""
+    _ENV_CACHE.clear()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory and its parents if they don't exist."""
+    try:
+        path.mkdir(parents=True, exist_ok=True)
+    except (PermissionError, OSError):
+        pass  # Skip directory creation if permission denied
 
 
 class Config:
@@ -32,7 +65,7 @@ class Config:
             max_retries: Maximum number of retries for failed operations
             **kwargs: Additional configuration options
         """
-        self.anthropic_api_key = anthropic_api_key or os.getenv("ANTHROPIC_API_KEY")
+        self.anthropic_api_key = anthropic_api_key or _env("ANTHROPIC_API_KEY")
 
         # Validate required fields
         if not self.anthropic_api_key:
@@ -44,37 +77,21 @@ class Config:
             debug if debug is not None else self._get_bool_env("DEBUG", default=False)
         )
         self.log_level = (
-            log_level if log_level is not None else os.getenv("LOG_LEVEL", "INFO")
+            log_level if log_level is not None else _env("LOG_LEVEL", "INFO")
         )
         self.flow_timeout = (
             flow_timeout
             if flow_timeout is not None
-            else int(os.getenv("FLOW_TIMEOUT", "300"))
+            else int(_env("FLOW_TIMEOUT", "300"))
         )
         self.max_retries = (
-            max_retries
-            if max_retries is not None
-            else int(os.getenv("MAX_RETRIES", "3"))
-        )
-
-        # Convert paths to Path objects and create directories
-        self.data_dir = (
-            Path(data_dir) if data_dir else Path(os.getenv("DATA_DIR", "data"))
-        )
-        self.logs_dir = (
-            Path(logs_dir) if logs_dir else Path(os.getenv("LOGS_DIR", "logs"))
+            max_retries if max_retries is not None else int(_env("MAX_RETRIES", "3"))
         )
 
-        # Create directories if they don't exist
-        try:
-            self.data_dir.mkdir(parents=True, exist_ok=True)
-        except (PermissionError, OSError):
-            pass  # Skip directory creation if permission denied
-
-        try:
-            self.logs_dir.mkdir(parents=True, exist_ok=True)
-        except (PermissionError, OSError):
-            pass  # Skip directory creation if permission denied
+        # Convert paths to Path objects. The directories are created when
+        # first accessed, so code that never uses them skips the mkdir calls.
+        self.data_dir = Path(data_dir) if data_dir else Path(_env("DATA_DIR", "data"))
+        self.logs_dir = Path(logs_dir) if logs_dir else Path(_env("LOGS_DIR", "logs"))
 
         # Store additional config options
         for key, value in kwargs.items():
@@ -90,24 +107,52 @@ class Config:
             Dictionary representation of config
         """
         exclude = exclude or set()
-        result = {}
 
-        for attr_name in dir(self):
-            # Skip private attributes, methods, and excluded attributes
-            if (
-                attr_name.startswith("_")
-                or callable(getattr(self, attr_name))
-                or attr_name in exclude
-            ):
-                continue
+        # All settings are instance attributes, so there is no need to walk
+        # the class hierarchy with dir() and filter out methods
+        result = {
+            key: value
+            for key, value in self.__dict__.items()
+            if not key.startswith("_") and key not in exclude
+        }
 
-            result[attr_name] = getattr(self, attr_name)
+        # Directory settings are properties backed by private attributes.
+        # Use the stored paths so serializing doesn't create the directories.
+        for key, value in (("data_dir", self._data_dir), ("logs_dir", self._logs_dir)):
+            if key not in exclude:
+                result[key] = value
 
         return result
 
+    @property
+    def data_dir(self) -> Path:
+        """Directory for data storage, created on first access."""
+        if not self._data_dir_ready:
+            _ensure_dir(self._data_dir)
+            self._data_dir_ready = True
+        return self._data_dir
+
+    @data_dir.setter
+    def data_dir(self, value: Path | str) -> None:
+        self._data_dir = Path(value)
+        self._data_dir_ready = False
+
+    @property
+    def logs_dir(self) -> Path:
+        """Directory for log files, created on first access."""
+        if not self._logs_dir_ready:
+            _ensure_dir(self._logs_dir)
+            self._logs_dir_ready = True
+        return self._logs_dir
+
+    @logs_dir.setter
+    def logs_dir(self, value: Path | str) -> None:
+        self._logs_dir = Path(value)
+        self._logs_dir_ready = False
+
     def _get_bool_env(self, env_name: str, *, default: bool) -> bool:
         """Get boolean value from environment variable."""
-        value = os.getenv(env_name)
+        value = _env(env_name)
         if value is None:
             return default
         return value.lower() in ("true", "1", "yes", "on")
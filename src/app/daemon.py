@@ -2,14 +2,44 @@
 
 import asyncio
 import logging
+import signal
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+def configure_loop(loop: asyncio.AbstractEventLoop | None = None) -> None:
+    """Run new tasks on the loop eagerly, where supported (Python 3.12+).
+
+    An eagerly started task runs synchronously until its first suspension,
+    so create_task(daemon.start()) has initialized flows and started the
+    daemon loop by the time it returns. On older Pythons this is a no-op.
+
+    Args:
+        loop: Event loop to configure, defaults to the running loop
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return
+    (loop or asyncio.get_running_loop()).set_task_factory(eager_task_factory)
+
+
 class FlowDaemon:
     """Daemon for managing and executing flows."""
 
+    __slots__ = (
+        "_flows",
+        "_pending",
+        "_signals",
+        "_started_event",
+        "_stop_event",
+        "_task",
+        "_wake",
+        "config",
+        "flows",
+    )
+
     def __init__(self, config: Any):
         """Initialize the flow daemon.
 
@@ -17,10 +47,42 @@ class FlowDaemon:
             config: Configuration object
         """
         self.config = config
-        self.flows: dict[str, Any] = {}
-        self._running = False
+        self._flows: dict[str, Any] = {}
+        # Read-only view; flows are changed through add_flow()/remove_flow()
+        self.flows: MappingProxyType[str, Any] = MappingProxyType(self._flows)
         self._task = None
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        # Set while the daemon is stopped; cleared by start() and set by stop()
+        self._stop_event = asyncio.Event()
+        self._stop_event.set()
+        # Set once start() has initialized flows and the daemon loop is running
+        self._started_event = asyncio.Event()
+        # Handlers that were in place before the daemon took over each signal
+        self._signals: dict[signal.Signals, Any] = {}
+        # Set whenever the daemon loop has something to do (new work or stop)
+        self._wake = asyncio.Event()
+        # Executions queued while running, batched per flow by the daemon loop
+        self._pending: dict[
+            str, list[tuple[dict[str, Any], asyncio.Future[dict[str, Any]]]]
+        ] = {}
+
+    @staticmethod
+    def install_uvloop() -> bool:
+        """Use uvloop for event loops created from now on, if it is installed.
+
+        Call this before starting the event loop that runs the daemon.
+        uvloop is an optional dependency (the ``uvloop`` extra) and isn't
+        available on Windows.
+
+        Returns:
+            True if uvloop was installed, False if it isn't available
+        """
+        try:
+            import uvloop  # noqa: PLC0415  # pyright: ignore[reportMissingImports]
+        except ImportError:
+            return False
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
 
     def add_flow(self, name: str, flow: Any) -> None:
         """Add a flow to the daemon.
@@ -29,8 +91,9 @@ class FlowDaemon:
             name: Name identifier for the flow
             flow: Flow object to add
         """
-        self.flows[name] = flow
-        self.logger.info(f"Added flow: {name}")
+        self._flows[name] = flow
+        logger.info("Added flow: %s", name)
+        self._wake.set()
 
     def remove_flow(self, name: str) -> Any | None:
         """Remove a flow from the daemon.
@@ -41,9 +104,9 @@ class FlowDaemon:
         Returns:
             The removed flow object, or None if not found
         """
-        if name in self.flows:
-            flow = self.flows.pop(name)
-            self.logger.info(f"Removed flow: {name}")
+        if name in self._flows:
+            flow = self._flows.pop(name)
+            logger.info("Removed flow: %s", name)
             return flow
         return None
 
@@ -56,58 +119,141 @@ class FlowDaemon:
         Returns:
             Flow object or None if not found
         """
-        return self.flows.get(name)
+        return self._flows.get(name)
+
+    async def start(self, *, handle_signals: bool = False) -> None:
+        """Start the daemon.
+
+        The daemon loop runs in a background task, so this returns once the
+        daemon is running.
 
-    async def start(self) -> None:
-        """Start the daemon."""
-        if self._running:
+        Args:
+            handle_signals: Stop the daemon on SIGINT and SIGTERM instead of
+                leaving those signals to the host application
+        """
+        if not self._stop_event.is_set():
             return
 
-        self._running = True
-        self.logger.info("Starting Flow Daemon...")
+        self._stop_event.clear()
+        logger.info("Starting Flow Daemon...")
 
         # Initialize flows
         await self._initialize_flows()
 
         # Start the main daemon loop
+        if handle_signals:
+            self._add_signal_handlers()
         self._task = asyncio.create_task(self._run_loop())
+        # Drop the finished task (and its frames) however the loop ends
+        self._task.add_done_callback(self._forget_task)
+        self._started_event.set()
 
     async def stop(self) -> None:
         """Stop the daemon."""
-        if not self._running:
+        if self._stop_event.is_set():
             return
 
-        self._running = False
-        self.logger.info("Stopping Flow Daemon...")
+        self._stop_event.set()
+        self._started_event.clear()
+        logger.info("Stopping Flow Daemon...")
+        self._wake.set()
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        if self._task is not None:
+            task = self._task
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
             self._task = None
 
+        # A loop task cancelled before it ever ran can't clean up after itself
+        self._remove_signal_handlers()
+
+        # Don't leave callers of execute_flow waiting on a stopped daemon
+        self._process_pending()
+
+    async def run_until_stopped(self) -> None:
+        """Run the daemon until it is stopped or receives SIGINT or SIGTERM.
+
+        Starts the daemon with signal handling if it isn't already running,
+        then waits for the daemon loop to finish.
+        """
+        await self.start(handle_signals=True)
+        task = self._task
+        await self._stop_event.wait()
+        if task is not None:
+            await asyncio.gather(task, return_exceptions=True)
+
     async def _run_loop(self) -> None:
         """Main daemon loop."""
         try:
-            while self._running:
+            while not self._stop_event.is_set():
                 try:
-                    # Process flows or handle requests
-                    await asyncio.sleep(1)  # Simple heartbeat
+                    if self._has_pending_work():
+                        # Only yield to other tasks; sleep(0) arms no timer
+                        await asyncio.sleep(0)
+                    else:
+                        # Sleep until there is work to do or the daemon stops
+                        await self._wake.wait()
+                        self._wake.clear()
+                    self._process_pending()
                 except asyncio.CancelledError:
                     break
                 except Exception:
-                    self.logger.exception("Error in daemon loop")
+                    logger.exception("Error in daemon loop")
         except KeyboardInterrupt:
-            self.logger.info("Received shutdown signal")
-            self._running = False
+            self._request_shutdown()
+        finally:
+            self._remove_signal_handlers()
+            # Don't leave executions queued before a signal-driven shutdown
+            self._process_pending()
+
+    def _forget_task(self, task: asyncio.Task[None]) -> None:
+        """Release the daemon loop task once it has finished."""
+        # A restarted daemon may already own a newer task
+        if self._task is task:
+            self._task = None
+
+    def _add_signal_handlers(self) -> None:
+        """Shut down on SIGINT and SIGTERM while the daemon loop runs."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            previous = signal.getsignal(sig)
+            try:
+                loop.add_signal_handler(sig, self._request_shutdown)
+            except (NotImplementedError, RuntimeError, ValueError):
+                # Unsupported by this loop (e.g. on Windows) or not running
+                # in the main thread; stop() still shuts the daemon down
+                continue
+            self._signals[sig] = previous
+
+    def _remove_signal_handlers(self) -> None:
+        """Restore the handlers replaced by _add_signal_handlers()."""
+        loop = asyncio.get_running_loop()
+        for sig, previous in self._signals.items():
+            loop.remove_signal_handler(sig)
+            # The loop resets SIGINT to Python's default handler, which would
+            # drop a handler installed by the host (e.g. asyncio.Runner)
+            if previous is not None:
+                signal.signal(sig, previous)
+        self._signals.clear()
+
+    def _request_shutdown(self) -> None:
+        """Stop the daemon loop in response to a shutdown signal."""
+        if self._stop_event.is_set():
+            return
+
+        logger.info("Received shutdown signal")
+        self._stop_event.set()
+        self._started_event.clear()
+        self._wake.set()
 
     async def execute_flow(
         self, flow_name: str, input_data: dict[str, Any]
     ) -> dict[str, Any]:
         """Execute a flow by name.
 
+        While the daemon is running, executions are queued and the daemon
+        loop runs all executions queued for the same flow as one batch.
+
         Args:
             flow_name: Name of the flow to execute
             input_data: Input data for the flow
@@ -115,6 +261,33 @@ class FlowDaemon:
         Returns:
             Flow execution result
 
+        Raises:
+            ValueError: If flow not found
+        """
+        if not self.get_flow(flow_name):
+            msg = f"Flow not found: {flow_name}"
+            raise ValueError(msg)
+
+        if self._stop_event.is_set():
+            return self._execute_batch(flow_name, [input_data])[0]
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(flow_name, []).append((input_data, future))
+        self._wake.set()
+        return await future
+
+    def _execute_batch(
+        self, flow_name: str, inputs: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """Execute a flow once for each input in a batch.
+
+        Args:
+            flow_name: Name of the flow to execute
+            inputs: Input data for each execution
+
+        Returns:
+            One result per input, in the same order
+
         Raises:
             ValueError: If flow not found
         """
@@ -123,25 +296,60 @@ class FlowDaemon:
             msg = f"Flow not found: {flow_name}"
             raise ValueError(msg)
 
-        self.logger.info(f"Executing flow: {flow_name}")
+        logger.info("Executing flow: %s (batch of %d)", flow_name, len(inputs))
 
         # Execute the flow (this would be implementation-specific)
         # For now, return a mock result
-        return {
-            "flow_name": flow_name,
-            "input": input_data,
-            "status": "completed",
-            "result": "Mock execution result",
-        }
+        return [
+            {
+                "flow_name": flow_name,
+                "input": input_data,
+                "status": "completed",
+                "result": "Mock execution result",
+            }
+            for input_data in inputs
+        ]
+
+    def _process_pending(self) -> None:
+        """Run all queued executions and resolve their futures."""
+        pending, self._pending = self._pending, {}
+
+        for flow_name, batch in pending.items():
+            try:
+                results = self._execute_batch(
+                    flow_name, [input_data for input_data, _ in batch]
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    @property
+    def logger(self) -> logging.Logger:
+        """Logger the daemon writes to, for use by subclasses."""
+        return logger
 
     @property
     def is_running(self) -> bool:
         """Check if daemon is running."""
-        return self._running
+        return not self._stop_event.is_set()
 
     def list_flows(self) -> list[str]:
         """List all registered flow names."""
-        return list(self.flows.keys())
+        return list(self._flows)
+
+    def _has_pending_work(self) -> bool:
+        """Check if the daemon loop has queued work to process.
+
+        Subclasses that queue additional work for the loop should extend
+        this so the loop keeps running instead of waiting to be woken up.
+        """
+        return bool(self._pending)
 
     async def _initialize_flows(self) -> None:
         """Initialize flows on daemon startup.
@@ -149,7 +357,7 @@ class FlowDaemon:
         This method can be overridden by subclasses to perform
         custom flow initialization logic.
         """
-        self.logger.info("Initializing flows...")
+        logger.info("Initializing flows...")
         # Default implementation does nothing
         # Subclasses can override to load flows from config, database, etc.
         pass
@@ -1,13 +1,12 @@
-"""Main entry point for the PocketFlow example application."""
-# ruff: noqa: T201, DTZ005, PLR2004
+"""Main entry point for the PocketFlow example application.
+
+Run from the repository root with ``python -m src.app.main``.
+"""
+# ruff: noqa: DTZ005
 
 import logging
 import sys
 from datetime import datetime
-from pathlib import Path
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.app.pocketflow.flows.examples import (
     data_pipeline_flow,
@@ -15,6 +14,22 @@ from src.app.pocketflow.flows.examples import (
     random_conditional_flow,
 )
 
+# Time of day for each hour of the clock
+_HOUR_TO_TIME_OF_DAY = ("morning",) * 12 + ("afternoon",) * 5 + ("evening",) * 7
+
+# Horizontal rule framing each section of output
+_RULE = "=" * 50
+
+
+def _section(title):
+    """Return the banner lines that open a section of output."""
+    return ["", _RULE, title, _RULE]
+
+
+def _write(lines):
+    """Write a block of output lines to stdout in a single call."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
 
 def setup_logging():
     """Configure logging for the application."""
@@ -27,36 +42,28 @@ def setup_logging():
 
 def run_greeting_example():
     """Run the greeting flow example."""
-    print("\n" + "=" * 50)
-    print("🎯 Running Greeting Flow Example")
-    print("=" * 50 + "\n")
-
-    # Determine time of day
-    hour = datetime.now().hour
-    if hour < 12:
-        time_of_day = "morning"
-    elif hour < 17:
-        time_of_day = "afternoon"
-    else:
-        time_of_day = "evening"
+    _write(_section("🎯 Running Greeting Flow Example"))
+
+    time_of_day = _HOUR_TO_TIME_OF_DAY[datetime.now().hour]
 
     # Run the flow
     result = greeting_flow.run({"name": "Developer", "time_of_day": time_of_day})
 
+    lines = [""]
+
     if result.get("action") == "success":
-        print(f"✅ {result['greeting']}")
-        print(f"📊 Metadata: {result.get('greeting_metadata', {})}")
+        lines.append(f"✅ {result['greeting']}")
+        lines.append(f"📊 Metadata: {result.get('greeting_metadata', {})}")
     else:
-        print(f"❌ Error: {result.get('error', 'Unknown error')}")
+        lines.append(f"❌ Error: {result.get('error', 'Unknown error')}")
 
+    _write(lines)
     return result
 
 
 def run_random_conditional_example():
     """Run the random number conditional flow example."""
-    print("\n" + "=" * 50)
-    print("🎲 Running Random Conditional Flow Example")
-    print("=" * 50 + "\n")
+    _write(_section("🎲 Running Random Conditional Flow Example"))
 
     # Set up the flow with random number generation and conditional logic
     initial_store = {
@@ -70,22 +77,23 @@ def run_random_conditional_example():
 
     result = random_conditional_flow.run(initial_store)
 
-    print(f"🔢 Generated number: {result.get('random_number', 'N/A')}")
-    print(f"📝 {result.get('message', '')}")
+    lines = [""]
+    lines.append(f"🔢 Generated number: {result.get('random_number', 'N/A')}")
+    lines.append(f"📝 {result.get('message', '')}")
 
     if "transformed_data" in result:
-        print(f"🔄 Transformed data: {result['transformed_data']}")
+        lines.append(f"🔄 Transformed data: {result['transformed_data']}")
 
-    print(f"\n📍 Flow path: {' -> '.join(result.get('_flow_path', []))}")
+    lines.append("")
+    lines.append(f"📍 Flow path: {' -> '.join(result.get('_flow_path', []))}")
 
+    _write(lines)
     return result
 
 
 def run_data_pipeline_example():
     """Run the data processing pipeline example."""
-    print("\n" + "=" * 50)
-    print("🔄 Running Data Pipeline Flow Example")
-    print("=" * 50 + "\n")
+    _write(_section("🔄 Running Data Pipeline Flow Example"))
 
     # Set up a multi-stage data transformation
     initial_store = {
@@ -102,12 +110,14 @@ def run_data_pipeline_example():
         result["input_data"] = result.get("transformed_data", [])
         result["transform_type"] = "reverse"
 
-    print("📊 Pipeline Results:")
-    print(f"  - Original: {initial_store['input_data']}")
-    print(f"  - Transformed: {result.get('transformed_data', 'N/A')}")
-    print(f"  - Transform stats: {result.get('transform_stats', {})}")
-    print(f"  - Flow completed: {result.get('_flow_completed', False)}")
+    lines = [""]
+    lines.append("📊 Pipeline Results:")
+    lines.append(f"  - Original: {initial_store['input_data']}")
+    lines.append(f"  - Transformed: {result.get('transformed_data', 'N/A')}")
+    lines.append(f"  - Transform stats: {result.get('transform_stats', {})}")
+    lines.append(f"  - Flow completed: {result.get('_flow_completed', False)}")
 
+    _write(lines)
     return result
 
 
@@ -115,30 +125,42 @@ def main():
     """Run all examples."""
     setup_logging()
 
-    print("\n🚀 Welcome to PocketFlow Examples!")
-    print("This demonstrates the basic concepts of nodes and flows.\n")
+    _write(
+        [
+            "",
+            "🚀 Welcome to PocketFlow Examples!",
+            "This demonstrates the basic concepts of nodes and flows.",
+            "",
+        ]
+    )
 
-    # Run examples
-    results = []
+    # Run examples one after another so each flow's log output appears
+    # under its own heading
+    results = [
+        run_greeting_example(),
+        run_random_conditional_example(),
+        run_data_pipeline_example(),
+    ]
 
-    results.append(run_greeting_example())
-    results.append(run_random_conditional_example())
-    results.append(run_data_pipeline_example())
+    successful = sum(1 for r in results if r.get("_flow_completed", False))
 
     # Summary
-    print("\n" + "=" * 50)
-    print("📋 Summary")
-    print("=" * 50)
-
-    successful = sum(1 for r in results if r.get("_flow_completed", False))
-    print(f"\n✅ Completed flows: {successful}/{len(results)}")
-
-    print("\n🎉 Examples completed!")
-    print("\n💡 Next steps:")
-    print("  - Check out src/nodes/examples.py to see node implementations")
-    print("  - Look at src/flows/examples.py to understand flow definitions")
-    print("  - Read DEVELOPMENT_GUIDE.md for the complete methodology")
-    print("  - Start building your own nodes and flows!")
+    lines = _section("📋 Summary")
+    lines.extend(
+        [
+            "",
+            f"✅ Completed flows: {successful}/{len(results)}",
+            "",
+            "🎉 Examples completed!",
+            "",
+            "💡 Next steps:",
+            "  - Check out src/nodes/examples.py to see node implementations",
+            "  - Look at src/flows/examples.py to understand flow definitions",
+            "  - Read DEVELOPMENT_GUIDE.md for the complete methodology",
+            "  - Start building your own nodes and flows!",
+        ]
+    )
+    _write(lines)
 
 
 if __name__ == "__main__":
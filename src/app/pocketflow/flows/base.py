@@ -1,26 +1,51 @@
 """Base flow implementation for PocketFlow."""
 
 import logging
+import sys
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
+
+from src.app.pocketflow.nodes.base import BaseNode
+from src.app.pocketflow.utils.loggers import get_logger
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FlowNode:
     """Configuration for a node in a flow."""
 
     node_class: type
     transitions: dict[str, str] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Interned names let transition and node lookups match on identity
+        self.transitions = {
+            sys.intern(action): sys.intern(target)
+            for action, target in self.transitions.items()
+        }
+
+
+class CompiledStep(NamedTuple):
+    """A flow node specialized for execution by BaseFlow.compile()."""
+
+    node: BaseNode
+    transitions: dict[str, str]
+    default_target: str
+    has_error_transition: bool
+
 
 class BaseFlow:
     """Base class for PocketFlow flows.
 
-    Manages node execution and transitions based on actions.
+    Manages node execution and transitions based on actions. Each node is
+    instantiated once per flow (see compile()) and reused for every step and
+    run, so nodes must keep per-run state in the store rather than on the
+    instance.
     """
 
+    __slots__ = ("_compiled_steps", "flow_definition", "logger", "name")
+
     def __init__(self, flow_definition: dict[str, FlowNode], name: str | None = None):
         """Initialize the flow with its definition.
 
@@ -30,8 +55,10 @@ class BaseFlow:
         """
         self.flow_definition = flow_definition
         self.name = name or self.__class__.__name__
-        self.logger = logging.getLogger(f"{__name__}.{self.name}")
+        self.logger = get_logger(__name__, self.name)
+        self._compiled_steps: dict[str, CompiledStep] = {}
         self._validate_flow()
+        self.compile()
 
     def _validate_flow(self) -> None:
         """Validate the flow definition."""
@@ -52,11 +79,59 @@ class BaseFlow:
                     )
                     raise ValueError(msg)
 
+        # Nodes no transition leads to are allowed, but almost always a mistake
+        reachable = {"start"}
+        to_visit = ["start"]
+        while to_visit:
+            node_config = self.flow_definition.get(to_visit.pop())
+            if node_config is None:  # 'end'
+                continue
+            for target_id in node_config.transitions.values():
+                if target_id not in reachable:
+                    reachable.add(target_id)
+                    to_visit.append(target_id)
+
+        unreachable = [
+            node_id for node_id in self.flow_definition if node_id not in reachable
+        ]
+        if unreachable:
+            self.logger.warning(
+                "Flow %s has unreachable nodes: %s", self.name, ", ".join(unreachable)
+            )
+
+    def compile(self) -> dict[str, CompiledStep]:
+        """Specialize the flow definition for execution.
+
+        Instantiates every node once and resolves each node's fallback
+        target and error handling up front, so each step of run() needs a
+        single lookup. The flow is compiled when it is created; call this
+        again after changing flow_definition.
+
+        Returns:
+            Dictionary mapping node IDs to their compiled steps
+        """
+        self._compiled_steps = {
+            node_id: CompiledStep(
+                node=node_config.node_class(),
+                transitions=dict(node_config.transitions),
+                default_target=node_config.transitions.get("default", "end"),
+                has_error_transition="error" in node_config.transitions,
+            )
+            for node_id, node_config in self.flow_definition.items()
+        }
+        return self._compiled_steps
+
     def run(
         self, initial_store: dict[str, Any] | None = None, max_steps: int = 100
     ) -> dict[str, Any]:
         """Execute the flow starting from the 'start' node.
 
+        The store is updated in place: the dictionary passed as
+        initial_store is the one returned. A store that already carries
+        flow bookkeeping (for example, one passed on from an enclosing flow)
+        keeps its flow name and has this flow's path appended to the
+        existing one.
+
         Args:
             initial_store: Initial state dictionary
             max_steps: Maximum steps to prevent infinite loops
@@ -64,37 +139,40 @@ class BaseFlow:
         Returns:
             Final store state after flow completion
         """
-        store = initial_store or {}
-        store["_flow_name"] = self.name
-        store["_flow_path"] = []
+        compiled_steps = self._compiled_steps
+
+        store = {} if initial_store is None else initial_store
+        store.setdefault("_flow_name", self.name)
+        flow_path = store.setdefault("_flow_path", [])
 
         current_node_id = "start"
         steps = 0
 
-        self.logger.info(f"Starting flow: {self.name}")
+        self.logger.info("Starting flow: %s", self.name)
 
         while current_node_id != "end" and steps < max_steps:
             steps += 1
 
             # Record the path
-            store["_flow_path"].append(current_node_id)
+            flow_path.append(current_node_id)
 
-            # Get the node configuration
-            if current_node_id not in self.flow_definition:
-                self.logger.error(f"Unknown node: {current_node_id}")
+            # Get the compiled node
+            step = compiled_steps.get(current_node_id)
+            if step is None:
+                self.logger.error("Unknown node: %s", current_node_id)
                 store["action"] = "error"
                 store["error"] = f"Unknown node: {current_node_id}"
                 break
 
-            node_config = self.flow_definition[current_node_id]
+            # Unpack once rather than going through the field accessors
+            node, transitions, default_target, has_error_transition = step
 
-            # Create and run the node
+            # Run the node
             try:
-                node = node_config.node_class()
-                self.logger.info(f"Executing node: {current_node_id}")
+                self.logger.info("Executing node: %s", current_node_id)
                 store = node.run(store)
             except Exception as e:
-                self.logger.error(f"Error in node {current_node_id}: {e!s}")
+                self.logger.error("Error in node %s: %s", current_node_id, e)
                 store["action"] = "error"
                 store["error"] = str(e)
                 store["error_node"] = current_node_id
@@ -103,23 +181,21 @@ class BaseFlow:
             # Determine the next node based on action
             action = store.get("action", "default")
 
-            if action == "error" and "error" not in node_config.transitions:
+            if action == "error" and not has_error_transition:
                 # If there's an error but no error transition, stop
-                self.logger.error(f"Error in node {current_node_id}, stopping flow")
+                self.logger.error("Error in node %s, stopping flow", current_node_id)
                 break
 
-            next_node_id = node_config.transitions.get(
-                action, node_config.transitions.get("default", "end")
-            )
+            next_node_id = transitions.get(action, default_target)
 
             self.logger.info(
-                f"Transition: {current_node_id} --[{action}]--> {next_node_id}"
+                "Transition: %s --[%s]--> %s", current_node_id, action, next_node_id
             )
 
             current_node_id = next_node_id
 
         if steps >= max_steps:
-            self.logger.error(f"Flow exceeded maximum steps ({max_steps})")
+            self.logger.error("Flow exceeded maximum steps (%d)", max_steps)
             store["action"] = "error"
             store["error"] = f"Flow exceeded maximum steps ({max_steps})"
 
@@ -127,8 +203,10 @@ class BaseFlow:
         store["_flow_completed"] = current_node_id == "end"
 
         self.logger.info(
-            f"Flow completed: {self.name} "
-            f"(steps: {steps}, completed: {store['_flow_completed']})"
+            "Flow completed: %s (steps: %d, completed: %s)",
+            self.name,
+            steps,
+            store["_flow_completed"],
         )
 
         return store
@@ -4,6 +4,7 @@ from src.app.pocketflow.flows.base import BaseFlow, FlowNode
 from src.app.pocketflow.nodes.examples import (
     ConditionalNode,
     DataTransformNode,
+    ErrorHandlerNode,
     GreetingNode,
     RandomNumberNode,
 )
@@ -60,8 +61,7 @@ data_pipeline_flow_definition = {
         transitions={"success": "end", "error": "error_handler"},
     ),
     "error_handler": FlowNode(
-        node_class=GreetingNode,  # Reusing as a simple logger
-        transitions={"success": "end", "error": "end"},
+        node_class=ErrorHandlerNode, transitions={"error": "end"}
     ),
 }
 
@@ -1,25 +1,38 @@
 """Base node implementations for PocketFlow."""
 
 import logging
-from abc import ABC, abstractmethod
 from typing import Any
 
+from src.app.pocketflow.utils.loggers import get_logger
+
 logger = logging.getLogger(__name__)
 
 
-class BaseNode(ABC):
+class BaseNode:
     """Base class for all PocketFlow nodes.
 
     Implements the three-phase lifecycle:
     1. prep() - Preparation and validation
     2. exec() - Main execution logic
     3. post() - Cleanup and finalization
+
+    Flows reuse a single node instance across runs, so any per-run state
+    belongs in the store and should be initialized in prep().
+
+    If the incoming store already carries an "error" action, the whole
+    lifecycle is skipped and the store is passed through unchanged. Nodes
+    that handle upstream errors should set ``handles_errors = True`` and
+    clear the error action in prep() so that exec() runs.
     """
 
+    __slots__ = ("logger", "name")
+
+    handles_errors: bool = False
+
     def __init__(self, name: str | None = None):
         """Initialize the node with an optional name."""
         self.name = name or self.__class__.__name__
-        self.logger = logging.getLogger(f"{__name__}.{self.name}")
+        self.logger = get_logger(__name__, self.name)
 
     def prep(self, store: dict[str, Any]) -> dict[str, Any]:
         """Preparation phase - validate inputs and setup.
@@ -35,22 +48,26 @@ class BaseNode(ABC):
         Returns:
             Updated store dictionary
         """
-        self.logger.debug(f"Preparing {self.name}")
+        self.logger.debug("Preparing %s", self.name)
         return store
 
-    @abstractmethod
     def exec(self, store: dict[str, Any]) -> dict[str, Any]:
         """Execution phase - main logic implementation.
 
-        This method must be implemented by all nodes.
+        This method must be implemented by all nodes. It isn't declared
+        abstract so that creating nodes avoids ABCMeta's instantiation check.
 
         Args:
             store: The shared state dictionary
 
         Returns:
             Updated store dictionary with results
+
+        Raises:
+            NotImplementedError: If the subclass doesn't implement exec()
         """
-        pass
+        msg = f"{self.__class__.__name__}.exec not implemented"
+        raise NotImplementedError(msg)
 
     def post(self, store: dict[str, Any]) -> dict[str, Any]:
         """Post-processing phase - cleanup and finalization.
@@ -66,7 +83,7 @@ class BaseNode(ABC):
         Returns:
             Final store state
         """
-        self.logger.debug(f"Post-processing {self.name}")
+        self.logger.debug("Post-processing %s", self.name)
         return store
 
     def run(self, store: dict[str, Any]) -> dict[str, Any]:
@@ -74,14 +91,20 @@ class BaseNode(ABC):
 
         Runs all three phases in order: prep → exec → post
 
+        Returns immediately if an upstream node already set an "error"
+        action, unless this node handles errors.
+
         Args:
             store: The shared state dictionary
 
         Returns:
             Final store state after all phases
         """
+        if store.get("action") == "error" and not self.handles_errors:
+            return store
+
         try:
-            self.logger.info(f"Running {self.name}")
+            self.logger.info("Running %s", self.name)
             store = self.prep(store)
 
             # Skip execution if prep phase set an error
@@ -91,12 +114,12 @@ class BaseNode(ABC):
             store = self.post(store)
 
             self.logger.info(
-                f"Completed {self.name} with action: {store.get('action', 'none')}"
+                "Completed %s with action: %s", self.name, store.get("action", "none")
             )
             return store
 
         except Exception as e:
-            self.logger.error(f"Error in {self.name}: {e!s}")
+            self.logger.error("Error in %s: %s", self.name, e)
             store["action"] = "error"
             store["error"] = str(e)
             store["error_node"] = self.name
@@ -106,6 +129,8 @@ class BaseNode(ABC):
 class ValidationMixin:
     """Mixin for common validation patterns."""
 
+    __slots__ = ()
+
     def validate_required_fields(
         self, store: dict[str, Any], required_fields: list[str]
     ) -> tuple[bool, str | None]:
@@ -138,8 +163,15 @@ class ValidationMixin:
             Tuple of (is_valid, error_message)
         """
         for field, expected_type in field_types.items():
-            if field in store and not isinstance(store[field], expected_type):
-                actual_type = type(store[field]).__name__
+            if field not in store:
+                continue
+
+            value = store[field]
+            # Exact type match is the common case and cheaper than isinstance
+            if type(value) is not expected_type and not isinstance(
+                value, expected_type
+            ):
+                actual_type = type(value).__name__
                 expected_type_name = expected_type.__name__
                 return (
                     False,
@@ -1,7 +1,8 @@
 """Example node implementations."""
 
 import random
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from src.app.pocketflow.nodes.base import BaseNode, ValidationMixin
 
@@ -9,6 +10,15 @@ from src.app.pocketflow.nodes.base import BaseNode, ValidationMixin
 class GreetingNode(BaseNode, ValidationMixin):
     """Example node that creates personalized greetings."""
 
+    __slots__ = ()
+
+    _GREETING_TEMPLATES: ClassVar[dict[str, str]] = {
+        "morning": "Good morning, {name}! ☀️",
+        "afternoon": "Good afternoon, {name}! 🌤️",
+        "evening": "Good evening, {name}! 🌙",
+        "day": "Hello, {name}! 👋",
+    }
+
     def prep(self, store: dict[str, Any]) -> dict[str, Any]:
         """Validate that name is provided."""
         # Use validation mixin for common patterns
@@ -27,17 +37,13 @@ class GreetingNode(BaseNode, ValidationMixin):
         if store.get("action") == "error":
             return store
 
-        name = store["name"]
         time_of_day = store.get("time_of_day", "day")
+        template = self._GREETING_TEMPLATES.get(
+            time_of_day, self._GREETING_TEMPLATES["day"]
+        )
 
-        greetings = {
-            "morning": f"Good morning, {name}! ☀️",
-            "afternoon": f"Good afternoon, {name}! 🌤️",
-            "evening": f"Good evening, {name}! 🌙",
-            "day": f"Hello, {name}! 👋",
-        }
-
-        store["greeting"] = greetings.get(time_of_day, greetings["day"])
+        # Only the selected greeting is formatted
+        store["greeting"] = template.format(name=store["name"])
         store["action"] = "success"
         return store
 
@@ -55,6 +61,8 @@ class GreetingNode(BaseNode, ValidationMixin):
 class RandomNumberNode(BaseNode):
     """Example node that generates random numbers."""
 
+    __slots__ = ()
+
     def prep(self, store: dict[str, Any]) -> dict[str, Any]:
         """Set default range if not provided."""
         if "min_value" not in store:
@@ -86,6 +94,14 @@ class RandomNumberNode(BaseNode):
 class DataTransformNode(BaseNode, ValidationMixin):
     """Example node that transforms data structures."""
 
+    __slots__ = ()
+
+    _TRANSFORMS: ClassVar[dict[str, Callable[[list[Any]], list[Any]]]] = {
+        "uppercase": lambda data: list(map(str.upper, map(str, data))),
+        "reverse": lambda data: data[::-1],
+        "sort": sorted,
+    }
+
     def prep(self, store: dict[str, Any]) -> dict[str, Any]:
         """Validate input data exists."""
         is_valid, error = self.validate_required_fields(store, ["input_data"])
@@ -110,18 +126,13 @@ class DataTransformNode(BaseNode, ValidationMixin):
         input_data = store["input_data"]
         transform_type = store.get("transform_type", "uppercase")
 
-        if transform_type == "uppercase":
-            transformed = [str(item).upper() for item in input_data]
-        elif transform_type == "reverse":
-            transformed = list(reversed(input_data))
-        elif transform_type == "sort":
-            transformed = sorted(input_data)
-        else:
+        transform = self._TRANSFORMS.get(transform_type)
+        if transform is None:
             store["action"] = "error"
             store["error"] = f"Unknown transform type: {transform_type}"
             return store
 
-        store["transformed_data"] = transformed
+        store["transformed_data"] = transform(input_data)
         store["action"] = "success"
 
         return store
@@ -140,6 +151,8 @@ class DataTransformNode(BaseNode, ValidationMixin):
 class ConditionalNode(BaseNode):
     """Example node that demonstrates conditional branching."""
 
+    __slots__ = ()
+
     def exec(self, store: dict[str, Any]) -> dict[str, Any]:
         """Evaluate condition and set appropriate action."""
         value = store.get("value", 0)
@@ -156,3 +169,27 @@ class ConditionalNode(BaseNode):
             store["message"] = f"Value {value} equals threshold {threshold}"
 
         return store
+
+
+class ErrorHandlerNode(BaseNode):
+    """Example node that reports an error raised earlier in the flow."""
+
+    __slots__ = ()
+
+    handles_errors = True
+
+    def prep(self, store: dict[str, Any]) -> dict[str, Any]:
+        """Take over the upstream error so that exec() runs."""
+        store["action"] = "handling_error"
+        return store
+
+    def exec(self, store: dict[str, Any]) -> dict[str, Any]:
+        """Log the upstream error and leave it as the flow's outcome."""
+        self.logger.warning(
+            "Handling error from %s: %s",
+            store.get("error_node", "an earlier node"),
+            store.get("error", "unknown error"),
+        )
+        store["error_handled"] = True
+        store["action"] = "error"
+        return store
@@ -0,0 +1,21 @@
+"""Logger helpers for PocketFlow components."""
+
+import functools
+import logging
+
+
+@functools.cache
+def get_logger(module: str, name: str) -> logging.Logger:
+    """Get the logger for a named component.
+
+    Results are cached per (module, name) so creating many nodes or flows
+    doesn't repeat the name formatting and logging manager lookup.
+
+    Args:
+        module: Module that defines the component
+        name: Name of the component
+
+    Returns:
+        Logger named "<module>.<name>"
+    """
+    return logging.getLogger(f"{module}.{name}")
@@ -1,20 +1,36 @@
 """Pytest configuration and shared fixtures."""
 
-import asyncio
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from src.app.config import Config
+from src.app.config import Config, clear_env_cache
+from src.app.daemon import FlowDaemon, configure_loop
+from src.app.pocketflow.nodes.examples import (
+    ConditionalNode,
+    DataTransformNode,
+    GreetingNode,
+    RandomNumberNode,
+)
 
+# Integration tests are skipped from the default run; collect them by passing
+# the directory explicitly, e.g. ``pytest tests/integration``.
+collect_ignore = ["integration"]
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+
+@pytest.fixture(autouse=True)
+def _fresh_env_cache():
+    """Make environment changes from monkeypatch visible to Config."""
+    clear_env_cache()
+    yield
+    clear_env_cache()
+
+
+@pytest.fixture
+async def eager_tasks():
+    """Run tasks created during the test eagerly on Python 3.12+."""
+    configure_loop()
 
 
 @pytest.fixture
@@ -38,6 +54,68 @@ def test_config(temp_dir):
     )
 
 
+@pytest.fixture(scope="session")
+def default_config(tmp_path_factory):
+    """Shared read-only configuration with default settings.
+
+    Tests that modify the config or check construction must build their own.
+    """
+    return Config(
+        anthropic_api_key="test_key",
+        data_dir=tmp_path_factory.mktemp("data"),
+        logs_dir=tmp_path_factory.mktemp("logs"),
+    )
+
+
+@pytest.fixture
+async def make_daemon(test_config):
+    """Factory for daemons that are stopped when the test finishes.
+
+    Keyword arguments override daemon attributes, for example
+    ``make_daemon(_initialize_flows=AsyncMock())``.
+    """
+    created = []
+
+    def _make(**overrides):
+        daemon_class = FlowDaemon
+        if overrides:
+            daemon_class = type(FlowDaemon.__name__, (FlowDaemon,), overrides)
+        daemon = daemon_class(test_config)
+        created.append(daemon)
+        return daemon
+
+    yield _make
+
+    for daemon in created:
+        await daemon.stop()
+
+
+# Example nodes keep per-run state in the store, so one instance of each can
+# serve every test in a module.
+@pytest.fixture(scope="module")
+def greeting_node():
+    """Shared GreetingNode instance."""
+    return GreetingNode()
+
+
+@pytest.fixture(scope="module")
+def random_number_node():
+    """Shared RandomNumberNode instance."""
+    return RandomNumberNode()
+
+
+@pytest.fixture(scope="module")
+def transform_node():
+    """Shared DataTransformNode instance."""
+    return DataTransformNode()
+
+
+@pytest.fixture(scope="module")
+def conditional_node():
+    """Shared ConditionalNode instance."""
+    return ConditionalNode()
+
+
 @pytest.fixture
 def sample_flow_data():
     """Sample flow data for testing."""
@@ -0,0 +1 @@
+"""Integration tests, collected only when their directory is targeted."""
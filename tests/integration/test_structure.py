@@ -0,0 +1,53 @@
+"""Tests to verify the project layout matches the documented structure."""
+
+from pathlib import Path
+
+import pytest
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skip(reason="Too brittle for solo development"),
+]
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+EXPECTED_DIRS = frozenset(
+    {
+        "src",
+        "src/nodes",
+        "src/flows",
+        "src/utils",
+        "tests",
+        "docs",
+        "planning",
+        "agents",
+        ".mdc",
+    }
+)
+
+REQUIRED_FILES = frozenset(
+    {
+        "README.md",
+        "DEVELOPMENT_GUIDE.md",
+        "CLAUDE.md",
+        "pyproject.toml",
+        "setup.sh",
+        ".env.example",
+        ".gitignore",
+        ".mdc/pocketflow-rules.md",
+        "docs/design.md",
+        "docs/flow-design.md",
+    }
+)
+
+
+def test_project_structure():
+    """Test that expected directories exist."""
+    missing = {path for path in EXPECTED_DIRS if not (PROJECT_ROOT / path).is_dir()}
+    assert not missing, f"Missing directories: {sorted(missing)}"
+
+
+def test_required_files():
+    """Test that required files exist."""
+    missing = {path for path in REQUIRED_FILES if not (PROJECT_ROOT / path).is_file()}
+    assert not missing, f"Missing files: {sorted(missing)}"
@@ -1,6 +1,5 @@
 """Tests for configuration management."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -11,10 +10,9 @@ from src.app.config import Config
 class TestConfigBasics:
     """Test basic configuration functionality."""
 
-    def test_config_with_required_fields(self):
+    def test_config_with_required_fields(self, default_config):
         """Test config creation with only required fields."""
-        config = Config(anthropic_api_key="test_key")
-        assert config.anthropic_api_key == "test_key"
+        assert default_config.anthropic_api_key == "test_key"
 
     def test_config_defaults(self):
         """Test default configuration values."""
@@ -49,6 +47,11 @@ class TestConfigBasics:
 class TestConfigEnvironment:
     """Test configuration from environment variables."""
 
+    @pytest.fixture(autouse=True)
+    def _api_key(self, monkeypatch):
+        """Provide the required API key through the environment."""
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
+
     def test_config_from_env_vars(self, monkeypatch):
         """Test loading config from environment variables."""
         monkeypatch.setenv("ANTHROPIC_API_KEY", "env_key")
@@ -77,9 +80,9 @@ class TestConfigEnvironment:
         assert config.anthropic_api_key == "override_key"
         assert config.debug is False
 
-    def test_config_boolean_parsing(self, monkeypatch):
-        """Test boolean environment variable parsing."""
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("env_value", "expected"),
+        [
             ("true", True),
             ("True", True),
             ("TRUE", True),
@@ -89,13 +92,13 @@ class TestConfigEnvironment:
             ("FALSE", False),
             ("0", False),
             ("", False),
-        ]
-
-        for env_value, expected in test_cases:
-            monkeypatch.setenv("ANTHROPIC_API_KEY", "test")
-            monkeypatch.setenv("DEBUG", env_value)
-            config = Config()
-            assert config.debug is expected
+        ],
+    )
+    def test_config_boolean_parsing(self, monkeypatch, env_value, expected):
+        """Test boolean environment variable parsing."""
+        monkeypatch.setenv("DEBUG", env_value)
+        config = Config()
+        assert config.debug is expected
 
 
 class TestConfigValidation:
@@ -134,67 +137,78 @@ class TestConfigValidation:
 class TestConfigDirectories:
     """Test directory creation and management."""
 
-    def test_directory_creation(self):
+    def test_directory_creation(self, tmp_path):
         """Test that directories are created automatically."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            data_dir = Path(temp_dir) / "test_data"
-            logs_dir = Path(temp_dir) / "test_logs"
-
-            Config(
-                anthropic_api_key="test",
-                data_dir=data_dir,
-                logs_dir=logs_dir,
-            )
-
-            # Directories should be created after config initialization
-            assert data_dir.exists()
-            assert logs_dir.exists()
-            assert data_dir.is_dir()
-            assert logs_dir.is_dir()
-
-    def test_nested_directory_creation(self):
+        data_dir = tmp_path / "test_data"
+        logs_dir = tmp_path / "test_logs"
+
+        config = Config(
+            anthropic_api_key="test",
+            data_dir=data_dir,
+            logs_dir=logs_dir,
+        )
+
+        # Directories should be created when first accessed
+        assert config.data_dir.is_dir()
+        assert config.logs_dir.is_dir()
+
+    def test_directories_created_lazily(self, tmp_path):
+        """Test that directories aren't created until they are accessed."""
+        data_dir = tmp_path / "lazy_data"
+        logs_dir = tmp_path / "lazy_logs"
+
+        config = Config(
+            anthropic_api_key="test",
+            data_dir=data_dir,
+            logs_dir=logs_dir,
+        )
+        config_dict = config.dict()
+
+        assert config_dict["data_dir"] == data_dir
+        assert config_dict["logs_dir"] == logs_dir
+        assert not data_dir.exists()
+        assert not logs_dir.exists()
+
+    def test_nested_directory_creation(self, tmp_path):
         """Test creation of nested directories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            nested_data = Path(temp_dir) / "deep" / "nested" / "data"
-            nested_logs = Path(temp_dir) / "deep" / "nested" / "logs"
+        nested_data = tmp_path / "deep" / "nested" / "data"
+        nested_logs = tmp_path / "deep" / "nested" / "logs"
 
-            Config(
-                anthropic_api_key="test",
-                data_dir=nested_data,
-                logs_dir=nested_logs,
-            )
+        config = Config(
+            anthropic_api_key="test",
+            data_dir=nested_data,
+            logs_dir=nested_logs,
+        )
 
-            assert nested_data.exists()
-            assert nested_logs.exists()
+        assert config.data_dir.exists()
+        assert config.logs_dir.exists()
 
-    def test_existing_directories(self):
+    def test_existing_directories(self, tmp_path):
         """Test behavior with existing directories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            data_dir = Path(temp_dir) / "existing_data"
-            logs_dir = Path(temp_dir) / "existing_logs"
+        data_dir = tmp_path / "existing_data"
+        logs_dir = tmp_path / "existing_logs"
 
-            # Create directories beforehand
-            data_dir.mkdir()
-            logs_dir.mkdir()
+        # Create directories beforehand
+        data_dir.mkdir()
+        logs_dir.mkdir()
 
-            Config(
-                anthropic_api_key="test",
-                data_dir=data_dir,
-                logs_dir=logs_dir,
-            )
+        config = Config(
+            anthropic_api_key="test",
+            data_dir=data_dir,
+            logs_dir=logs_dir,
+        )
 
-            # Should not raise an error
-            assert data_dir.exists()
-            assert logs_dir.exists()
+        # Should not raise an error
+        assert config.data_dir.exists()
+        assert config.logs_dir.exists()
 
 
 class TestConfigSerialization:
     """Test configuration serialization and representation."""
 
-    def test_config_repr(self):
+    def test_config_repr(self, default_config):
         """Test config string representation."""
-        config = Config(anthropic_api_key="test_key")
-        repr_str = repr(config)
+        repr_str = repr(default_config)
         assert "Config" in repr_str
         # API key should not be in repr for security
         assert "test_key" not in repr_str
@@ -211,10 +225,9 @@ class TestConfigSerialization:
         assert config_dict["debug"] is True
         assert config_dict["log_level"] == "DEBUG"
 
-    def test_config_dict_exclude_secrets(self):
+    def test_config_dict_exclude_secrets(self, default_config):
         """Test excluding secrets from dictionary representation."""
-        config = Config(anthropic_api_key="secret_key")
-        config_dict = config.dict(exclude={"anthropic_api_key"})
+        config_dict = default_config.dict(exclude={"anthropic_api_key"})
         assert "anthropic_api_key" not in config_dict
         assert "debug" in config_dict
 
@@ -1,11 +1,21 @@
 """Tests for the flow daemon."""
 
 import asyncio
+import logging
+import os
+import signal
+import sys
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from src.app.daemon import FlowDaemon
+from src.app.daemon import FlowDaemon, configure_loop
+
+
+async def _finish(start_task):
+    """Make sure a background daemon start task has finished."""
+    start_task.cancel()
+    await asyncio.gather(start_task, return_exceptions=True)
 
 
 class MockFlow:
@@ -18,16 +28,16 @@ class MockFlow:
 class TestFlowDaemonBasics:
     """Test basic daemon functionality."""
 
-    def test_daemon_initialization(self, test_config):
+    def test_daemon_initialization(self, make_daemon, test_config):
         """Test daemon is initialized correctly."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         assert daemon.config == test_config
         assert daemon.flows == {}
-        assert daemon._running is False
+        assert daemon.is_running is False
 
-    def test_add_single_flow(self, test_config):
+    def test_add_single_flow(self, make_daemon):
         """Test adding a single flow."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         mock_flow = MockFlow("test_flow")
 
         daemon.add_flow("test_flow", mock_flow)
@@ -36,9 +46,9 @@ class TestFlowDaemonBasics:
         assert daemon.flows["test_flow"] == mock_flow
         assert len(daemon.flows) == 1
 
-    def test_add_multiple_flows(self, test_config):
+    def test_add_multiple_flows(self, make_daemon):
         """Test adding multiple flows."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         flows = {}
 
         for i in range(5):
@@ -51,9 +61,9 @@ class TestFlowDaemonBasics:
         for flow_name, flow in flows.items():
             assert daemon.flows[flow_name] == flow
 
-    def test_remove_existing_flow(self, test_config):
+    def test_remove_existing_flow(self, make_daemon):
         """Test removing an existing flow."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         mock_flow = MockFlow()
 
         daemon.add_flow("test_flow", mock_flow)
@@ -63,18 +73,18 @@ class TestFlowDaemonBasics:
         assert "test_flow" not in daemon.flows
         assert len(daemon.flows) == 0
 
-    def test_remove_nonexistent_flow(self, test_config):
+    def test_remove_nonexistent_flow(self, make_daemon):
         """Test removing a flow that doesn't exist."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
 
         result = daemon.remove_flow("nonexistent_flow")
 
         assert result is None
         assert len(daemon.flows) == 0
 
-    def test_replace_existing_flow(self, test_config):
+    def test_replace_existing_flow(self, make_daemon):
         """Test replacing an existing flow with same name."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         old_flow = MockFlow()
         new_flow = MockFlow()
 
@@ -85,135 +95,220 @@ class TestFlowDaemonBasics:
         assert daemon.flows["test_flow"] != old_flow
         assert len(daemon.flows) == 1
 
+    def test_flows_is_read_only_view(self, make_daemon):
+        """Test that flows reflects changes but can't be modified directly."""
+        daemon = make_daemon()
+        flows = daemon.flows
+
+        daemon.add_flow("test_flow", MockFlow())
+
+        assert "test_flow" in flows
+        with pytest.raises(TypeError):
+            daemon.flows["other_flow"] = MockFlow()
+
+    def test_install_uvloop_without_uvloop(self):
+        """Test that install_uvloop leaves the loop policy alone if unavailable."""
+        with (
+            patch.dict("sys.modules", {"uvloop": None}),
+            patch("asyncio.set_event_loop_policy") as mock_set_policy,
+        ):
+            assert FlowDaemon.install_uvloop() is False
+
+        mock_set_policy.assert_not_called()
+
 
 class TestFlowDaemonLifecycle:
     """Test daemon lifecycle management."""
 
-    async def test_daemon_start_sets_running_flag(self, test_config):
+    async def test_daemon_start_sets_running_flag(self, make_daemon):
         """Test that starting daemon sets running flag."""
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
         # Start daemon in background
         start_task = asyncio.create_task(daemon.start())
 
-        # Give it time to start
-        await asyncio.sleep(0.1)
+        # Wait until it has started
+        await daemon._started_event.wait()
 
-        assert daemon._running is True
+        assert daemon.is_running is True
 
         # Clean up
         await daemon.stop()
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
-    async def test_daemon_stop_clears_running_flag(self, test_config):
+    async def test_daemon_stop_clears_running_flag(self, make_daemon):
         """Test that stopping daemon clears running flag."""
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
         # Start and stop daemon
         start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
+        await daemon._started_event.wait()
         await daemon.stop()
 
-        assert daemon._running is False
+        assert daemon.is_running is False
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
-    async def test_daemon_initializes_flows_on_start(self, test_config):
+    async def test_daemon_initializes_flows_on_start(self, make_daemon):
         """Test that daemon initializes flows when starting."""
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
         start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
+        await daemon._started_event.wait()
         await daemon.stop()
 
         daemon._initialize_flows.assert_called_once()
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
-    async def test_daemon_handles_keyboard_interrupt(self, test_config):
+    async def test_daemon_handles_keyboard_interrupt(self, make_daemon):
         """Test daemon handles KeyboardInterrupt gracefully."""
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
         # Start daemon
         await daemon.start()
+        loop_task = daemon._task
 
-        # Mock sleep to raise KeyboardInterrupt in the running loop
-        with patch("asyncio.sleep", side_effect=KeyboardInterrupt):
+        # Make the loop's idle wait raise KeyboardInterrupt
+        with patch.object(daemon._wake, "wait", side_effect=KeyboardInterrupt):
             # Wait for the task to complete (it should handle the interrupt)
-            if daemon._task:
-                await daemon._task
+            await loop_task
+
+        assert daemon.is_running is False
+        # The finished task is released rather than kept on the daemon
+        assert daemon._task is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX signals")
+    async def test_daemon_stops_on_sigterm(self, make_daemon):
+        """Test that SIGTERM shuts the running daemon down."""
+        daemon = make_daemon(_initialize_flows=AsyncMock())
+        await daemon.start(handle_signals=True)
+        loop_task = daemon._task
+
+        assert signal.SIGTERM in daemon._signals
+
+        os.kill(os.getpid(), signal.SIGTERM)
+        await loop_task
+
+        assert daemon.is_running is False
+        assert daemon._task is None
+        assert daemon._signals == {}
+
+    async def test_daemon_start_leaves_signals_alone(self, make_daemon):
+        """Test that signal handling is opt-in."""
+        daemon = make_daemon(_initialize_flows=AsyncMock())
+        previous = signal.getsignal(signal.SIGINT)
+
+        await daemon.start()
+
+        assert daemon._signals == {}
+        assert signal.getsignal(signal.SIGINT) is previous
+
+        await daemon.stop()
 
-        assert daemon._running is False
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX signals")
+    async def test_daemon_stop_restores_signal_handlers(self, make_daemon):
+        """Test that stopping the daemon puts back the previous handlers."""
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
-    async def test_daemon_stop_without_start(self, test_config):
+        def handler(signum, frame):
+            pass
+
+        previous = signal.signal(signal.SIGTERM, handler)
+        try:
+            await daemon.start(handle_signals=True)
+            await daemon.stop()
+
+            assert daemon._signals == {}
+            assert signal.getsignal(signal.SIGTERM) is handler
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="needs POSIX signals")
+    async def test_run_until_stopped_returns_on_sigterm(self, make_daemon):
+        """Test that run_until_stopped returns once a signal stops the daemon."""
+        daemon = make_daemon(_initialize_flows=AsyncMock())
+
+        run_task = asyncio.create_task(daemon.run_until_stopped())
+        await daemon._started_event.wait()
+        os.kill(os.getpid(), signal.SIGTERM)
+        await run_task
+
+        assert daemon.is_running is False
+        assert daemon._task is None
+        assert daemon._signals == {}
+
+    async def test_daemon_restart_keeps_new_task(self, make_daemon):
+        """Test that the previous loop task doesn't clear a restarted one."""
+        daemon = make_daemon(_initialize_flows=AsyncMock())
+
+        await daemon.start()
+        await daemon.stop()
+        await daemon.start()
+        await asyncio.sleep(0)  # Let the old task's callbacks run
+
+        assert daemon._task is not None
+        assert not daemon._task.done()
+
+        await daemon.stop()
+        assert daemon._task is None
+
+    async def test_daemon_stop_without_start(self, make_daemon):
         """Test stopping daemon that was never started."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
 
         # Should not raise any errors
         await daemon.stop()
-        assert daemon._running is False
+        assert daemon.is_running is False
 
-    async def test_daemon_multiple_stops(self, test_config):
+    async def test_daemon_multiple_stops(self, make_daemon):
         """Test calling stop multiple times."""
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
         # Start daemon
         start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
+        await daemon._started_event.wait()
 
         # Stop multiple times
         await daemon.stop()
         await daemon.stop()
         await daemon.stop()
 
-        assert daemon._running is False
+        assert daemon.is_running is False
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
+    async def test_configure_loop_uses_eager_tasks(self):
+        """Test that configure_loop installs the eager task factory if available."""
+        configure_loop()
 
+        loop = asyncio.get_running_loop()
+        expected = getattr(asyncio, "eager_task_factory", None)
+        assert loop.get_task_factory() is expected
+
+
+@pytest.mark.usefixtures("eager_tasks")
 class TestFlowDaemonWithFlows:
     """Test daemon behavior with flows."""
 
-    async def test_daemon_with_single_flow(self, test_config):
+    async def test_daemon_with_single_flow(self, make_daemon):
         """Test daemon managing a single flow."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon(_initialize_flows=AsyncMock())
         mock_flow = MockFlow()
-        daemon._initialize_flows = AsyncMock()
 
         daemon.add_flow("test_flow", mock_flow)
 
         start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
+        await daemon._started_event.wait()
         await daemon.stop()
 
         assert "test_flow" in daemon.flows
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
-    async def test_daemon_with_multiple_flows(self, test_config):
+    async def test_daemon_with_multiple_flows(self, make_daemon):
         """Test daemon managing multiple flows."""
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
         flows = {}
         for i in range(3):
@@ -223,22 +318,18 @@ class TestFlowDaemonWithFlows:
             daemon.add_flow(flow_name, mock_flow)
 
         start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
+        await daemon._started_event.wait()
         await daemon.stop()
 
         assert len(daemon.flows) == 3
         for flow_name in flows:
             assert flow_name in daemon.flows
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
-    async def test_daemon_flow_cleanup_on_stop(self, test_config):
+    async def test_daemon_flow_cleanup_on_stop(self, make_daemon):
         """Test that flows are handled during daemon stop."""
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
         # Add flows
         for i in range(3):
@@ -246,117 +337,153 @@ class TestFlowDaemonWithFlows:
             daemon.add_flow(f"flow_{i}", mock_flow)
 
         start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
+        await daemon._started_event.wait()
         await daemon.stop()
 
         # Flows should still be in the daemon (cleanup is logged but flows remain)
         assert len(daemon.flows) == 3
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
+
+
+class TestFlowDaemonExecution:
+    """Test flow execution through the daemon."""
+
+    async def test_execute_flow_when_stopped(self, make_daemon):
+        """Test executing a flow while the daemon is not running."""
+        daemon = make_daemon()
+        daemon.add_flow("test_flow", MockFlow())
+
+        result = await daemon.execute_flow("test_flow", {"key": "value"})
+
+        assert result["flow_name"] == "test_flow"
+        assert result["input"] == {"key": "value"}
+        assert result["status"] == "completed"
+
+    async def test_execute_unknown_flow(self, make_daemon):
+        """Test executing a flow that doesn't exist."""
+        daemon = make_daemon()
+
+        with pytest.raises(ValueError, match="Flow not found"):
+            await daemon.execute_flow("missing_flow", {})
+
+    async def test_concurrent_executions_are_batched(self, make_daemon):
+        """Test that executions queued together run as one batch."""
+        daemon = make_daemon(_initialize_flows=AsyncMock())
+        daemon.add_flow("test_flow", MockFlow())
+        await daemon.start()
+
+        with patch.object(
+            daemon, "_execute_batch", wraps=daemon._execute_batch
+        ) as mock_execute:
+            results = await asyncio.gather(
+                *(daemon.execute_flow("test_flow", {"i": i}) for i in range(3))
+            )
+
+        await daemon.stop()
+
+        assert [result["input"] for result in results] == [
+            {"i": 0},
+            {"i": 1},
+            {"i": 2},
+        ]
+        mock_execute.assert_called_once_with(
+            "test_flow", [{"i": 0}, {"i": 1}, {"i": 2}]
+        )
 
 
 class TestFlowDaemonLogging:
     """Test daemon logging behavior."""
 
-    @patch("logging.getLogger")
-    def test_add_flow_logging(self, mock_get_logger, test_config):
+    def test_logger_is_module_logger(self, make_daemon):
+        """Test that subclasses can log through the daemon's logger."""
+        daemon = make_daemon()
+
+        assert daemon.logger is logging.getLogger("src.app.daemon")
+
+    def test_add_flow_logging(self, make_daemon, caplog):
         """Test that adding flows is logged."""
-        mock_logger = mock_get_logger.return_value
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         mock_flow = MockFlow()
 
-        daemon.add_flow("test_flow", mock_flow)
+        with caplog.at_level(logging.INFO, logger="src.app.daemon"):
+            daemon.add_flow("test_flow", mock_flow)
 
-        mock_logger.info.assert_called_with("Added flow: test_flow")
+        assert caplog.record_tuples == [
+            ("src.app.daemon", logging.INFO, "Added flow: test_flow")
+        ]
 
-    @patch("logging.getLogger")
-    def test_remove_flow_logging(self, mock_get_logger, test_config):
+    def test_remove_flow_logging(self, make_daemon, caplog):
         """Test that removing flows is logged."""
-        mock_logger = mock_get_logger.return_value
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         mock_flow = MockFlow()
 
-        daemon.add_flow("test_flow", mock_flow)
-        daemon.remove_flow("test_flow")
+        with caplog.at_level(logging.INFO, logger="src.app.daemon"):
+            daemon.add_flow("test_flow", mock_flow)
+            daemon.remove_flow("test_flow")
 
-        # Should have two calls: one for add, one for remove
-        calls = mock_logger.info.call_args_list
-        assert any("Added flow: test_flow" in str(call) for call in calls)
-        assert any("Removed flow: test_flow" in str(call) for call in calls)
+        # One record for the add, one for the remove, in that order
+        assert caplog.record_tuples == [
+            ("src.app.daemon", logging.INFO, "Added flow: test_flow"),
+            ("src.app.daemon", logging.INFO, "Removed flow: test_flow"),
+        ]
 
-    @patch("logging.getLogger")
-    async def test_daemon_start_logging(self, mock_get_logger, test_config):
+    async def test_daemon_start_logging(self, make_daemon, caplog):
         """Test that daemon start is logged."""
-        mock_logger = mock_get_logger.return_value
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
-        start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
-        await daemon.stop()
+        with caplog.at_level(logging.INFO, logger="src.app.daemon"):
+            start_task = asyncio.create_task(daemon.start())
+            await daemon._started_event.wait()
+            await daemon.stop()
 
-        mock_logger.info.assert_any_call("Starting Flow Daemon...")
+        assert "Starting Flow Daemon..." in caplog.text
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
-    @patch("logging.getLogger")
-    async def test_daemon_stop_logging(self, mock_get_logger, test_config):
+    async def test_daemon_stop_logging(self, make_daemon, caplog):
         """Test that daemon stop is logged."""
-        mock_logger = mock_get_logger.return_value
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock()
+        daemon = make_daemon(_initialize_flows=AsyncMock())
 
-        start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
-        await daemon.stop()
+        with caplog.at_level(logging.INFO, logger="src.app.daemon"):
+            start_task = asyncio.create_task(daemon.start())
+            await daemon._started_event.wait()
+            await daemon.stop()
 
-        mock_logger.info.assert_any_call("Stopping Flow Daemon...")
+        assert "Stopping Flow Daemon..." in caplog.text
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
-    @patch("logging.getLogger")
-    async def test_flow_initialization_logging(self, mock_get_logger, test_config):
+    async def test_flow_initialization_logging(self, make_daemon, caplog):
         """Test that flow initialization is logged."""
-        mock_logger = mock_get_logger.return_value
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         # Don't mock _initialize_flows so the real implementation runs and logs
 
-        start_task = asyncio.create_task(daemon.start())
-        await asyncio.sleep(0.1)
-        await daemon.stop()
+        with caplog.at_level(logging.INFO, logger="src.app.daemon"):
+            start_task = asyncio.create_task(daemon.start())
+            await daemon._started_event.wait()
+            await daemon.stop()
 
-        mock_logger.info.assert_any_call("Initializing flows...")
+        assert "Initializing flows..." in caplog.text
 
-        try:
-            await asyncio.wait_for(start_task, timeout=1.0)
-        except asyncio.TimeoutError:
-            start_task.cancel()
+        await _finish(start_task)
 
 
 class TestFlowDaemonEdgeCases:
     """Test edge cases and error conditions."""
 
-    def test_add_flow_with_none_flow(self, test_config):
+    def test_add_flow_with_none_flow(self, make_daemon):
         """Test adding None as a flow."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
 
         daemon.add_flow("none_flow", None)
 
         assert "none_flow" in daemon.flows
         assert daemon.flows["none_flow"] is None
 
-    def test_add_flow_with_empty_name(self, test_config):
+    def test_add_flow_with_empty_name(self, make_daemon):
         """Test adding flow with empty name."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         mock_flow = MockFlow()
 
         daemon.add_flow("", mock_flow)
@@ -364,9 +491,9 @@ class TestFlowDaemonEdgeCases:
         assert "" in daemon.flows
         assert daemon.flows[""] == mock_flow
 
-    def test_add_flow_with_special_characters(self, test_config):
+    def test_add_flow_with_special_characters(self, make_daemon):
         """Test adding flow with special characters in name."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         mock_flow = MockFlow()
         special_name = "flow-with_special.chars@123"
 
@@ -375,29 +502,30 @@ class TestFlowDaemonEdgeCases:
         assert special_name in daemon.flows
         assert daemon.flows[special_name] == mock_flow
 
-    def test_remove_flow_from_empty_daemon(self, test_config):
+    def test_remove_flow_from_empty_daemon(self, make_daemon):
         """Test removing flow when daemon has no flows."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
 
         result = daemon.remove_flow("any_flow")
 
         assert result is None
         assert len(daemon.flows) == 0
 
-    async def test_daemon_with_failing_initialization(self, test_config):
+    async def test_daemon_with_failing_initialization(self, make_daemon):
         """Test daemon when flow initialization fails."""
-        daemon = FlowDaemon(test_config)
-        daemon._initialize_flows = AsyncMock(side_effect=Exception("Init failed"))
+        daemon = make_daemon(
+            _initialize_flows=AsyncMock(side_effect=Exception("Init failed"))
+        )
 
         # Should not raise exception, daemon should handle it gracefully
         with pytest.raises(Exception, match="Init failed"):
             start_task = asyncio.create_task(daemon.start())
-            await asyncio.sleep(0.1)
+            await asyncio.sleep(0)
             await start_task
 
-    def test_daemon_config_mutation(self, test_config):
+    def test_daemon_config_mutation(self, make_daemon, test_config):
         """Test that daemon doesn't break if config is mutated."""
-        daemon = FlowDaemon(test_config)
+        daemon = make_daemon()
         original_timeout = test_config.flow_timeout
 
         # Mutate config
@@ -409,63 +537,50 @@ class TestFlowDaemonEdgeCases:
 
 
 class TestFlowDaemonConcurrency:
-    """Test daemon behavior under concurrent operations."""
+    """Test daemon state after many interleaved operations.
 
-    async def test_concurrent_flow_additions(self, test_config):
-        """Test adding flows concurrently."""
-        daemon = FlowDaemon(test_config)
+    add_flow and remove_flow are synchronous, so they run back to back
+    rather than wrapped in tasks.
+    """
 
-        async def add_flow(i):
-            mock_flow = MockFlow()
-            daemon.add_flow(f"concurrent_flow_{i}", mock_flow)
+    def test_concurrent_flow_additions(self, make_daemon):
+        """Test adding many flows."""
+        daemon = make_daemon()
 
-        # Add flows concurrently
-        tasks = [add_flow(i) for i in range(10)]
-        await asyncio.gather(*tasks)
+        for i in range(10):
+            daemon.add_flow(f"concurrent_flow_{i}", MockFlow())
 
         assert len(daemon.flows) == 10
         for i in range(10):
             assert f"concurrent_flow_{i}" in daemon.flows
 
-    async def test_concurrent_flow_removals(self, test_config):
-        """Test removing flows concurrently."""
-        daemon = FlowDaemon(test_config)
+    def test_concurrent_flow_removals(self, make_daemon):
+        """Test removing many flows."""
+        daemon = make_daemon()
 
         # Add flows first
         for i in range(10):
             mock_flow = MockFlow()
             daemon.add_flow(f"concurrent_flow_{i}", mock_flow)
 
-        async def remove_flow(i):
+        for i in range(10):
             daemon.remove_flow(f"concurrent_flow_{i}")
 
-        # Remove flows concurrently
-        tasks = [remove_flow(i) for i in range(10)]
-        await asyncio.gather(*tasks)
-
         assert len(daemon.flows) == 0
 
-    async def test_concurrent_mixed_operations(self, test_config):
-        """Test mixed concurrent operations."""
-        daemon = FlowDaemon(test_config)
-
-        async def add_flow(i):
-            mock_flow = MockFlow()
-            daemon.add_flow(f"add_flow_{i}", mock_flow)
-
-        async def remove_flow(i):
-            daemon.remove_flow(f"remove_flow_{i}")
+    def test_concurrent_mixed_operations(self, make_daemon):
+        """Test interleaved add and remove operations."""
+        daemon = make_daemon()
 
         # Pre-populate some flows to remove
         for i in range(5):
             mock_flow = MockFlow()
             daemon.add_flow(f"remove_flow_{i}", mock_flow)
 
-        # Mix of add and remove operations
-        add_tasks = [add_flow(i) for i in range(5)]
-        remove_tasks = [remove_flow(i) for i in range(5)]
-
-        await asyncio.gather(*add_tasks, *remove_tasks)
+        # Interleave add and remove operations
+        for i in range(5):
+            daemon.add_flow(f"add_flow_{i}", MockFlow())
+            daemon.remove_flow(f"remove_flow_{i}")
 
         # Should have 5 flows (added 5, removed 5)
         assert len(daemon.flows) == 5
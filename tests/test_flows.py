@@ -1,5 +1,7 @@
 """Comprehensive tests for flow execution and integration."""
 
+import logging
+import sys
 from unittest.mock import patch
 
 import pytest
@@ -14,6 +16,45 @@ from src.app.pocketflow.nodes.base import BaseNode
 from src.app.pocketflow.nodes.examples import GreetingNode
 
 
+class ErrorNode(BaseNode):
+    """Test node that always raises an error."""
+
+    def exec(self, store):  # noqa: ARG002
+        msg = "Test error"
+        raise RuntimeError(msg)
+
+
+class RecoveryNode(BaseNode):
+    """Test node that recovers from an upstream error."""
+
+    handles_errors = True
+
+    def prep(self, store):
+        store["recovered_from"] = store.pop("error")
+        store["action"] = "recovering"
+        return store
+
+    def exec(self, store):
+        store["action"] = "success"
+        return store
+
+
+class LoopNode(BaseNode):
+    """Test node that always returns the 'loop' action."""
+
+    def exec(self, store):
+        store["action"] = "loop"
+        return store
+
+
+class CustomActionNode(BaseNode):
+    """Test node that returns a custom action."""
+
+    def exec(self, store):
+        store["action"] = store.get("custom_action", "default")
+        return store
+
+
 class TestBaseFlow:
     """Test the BaseFlow class functionality."""
 
@@ -60,6 +101,61 @@ class TestBaseFlow:
         flow = BaseFlow(flow_def)
         assert flow.flow_definition["start"].transitions["success"] == "end"
 
+    def test_flow_validation_unreachable_node(self, caplog):
+        """Test that nodes no transition leads to are reported."""
+        flow_def = {
+            "start": FlowNode(node_class=GreetingNode, transitions={"success": "end"}),
+            "orphan": FlowNode(node_class=GreetingNode),
+        }
+
+        with caplog.at_level(logging.WARNING):
+            BaseFlow(flow_def, name="OrphanFlow")
+
+        assert "Flow OrphanFlow has unreachable nodes: orphan" in caplog.text
+
+    def test_flow_compile(self):
+        """Test compiling a flow resolves each node's step once."""
+        flow_def = {
+            "start": FlowNode(
+                node_class=GreetingNode,
+                transitions={"success": "end", "error": "end"},
+            )
+        }
+        flow = BaseFlow(flow_def, name="CompileTestFlow")
+
+        # Flows are compiled when they are created
+        assert flow._compiled_steps.keys() == {"start"}
+
+        compiled = flow.compile()
+
+        step = compiled["start"]
+        assert isinstance(step.node, GreetingNode)
+        assert step.transitions == {"success": "end", "error": "end"}
+        assert step.default_target == "end"
+        assert step.has_error_transition is True
+
+        # Runs reuse the compiled steps instead of recompiling
+        flow.run({"name": "First"})
+        flow.run({"name": "Second"})
+        assert flow._compiled_steps["start"].node is step.node
+
+    def test_flow_compile_default_target(self):
+        """Test that a 'default' transition becomes the compiled fallback."""
+        flow_def = {
+            "start": FlowNode(
+                node_class=GreetingNode,
+                transitions={"default": "next"},
+            ),
+            "next": FlowNode(node_class=GreetingNode),
+        }
+        flow = BaseFlow(flow_def)
+
+        compiled = flow.compile()
+
+        assert compiled["start"].default_target == "next"
+        assert compiled["start"].has_error_transition is False
+        assert compiled["next"].default_target == "end"
+
 
 class TestFlowExecution:
     """Test flow execution scenarios."""
@@ -96,37 +192,28 @@ class TestFlowExecution:
         assert len(result["_flow_path"]) >= 2  # May vary due to error handling
         assert "start" in result["_flow_path"]
 
-    def test_conditional_flow_execution(self):
-        """Test conditional flow with different paths."""
-        # Test multiple runs to get different conditional paths
-        results = []
-        for _ in range(10):
+    @pytest.mark.parametrize("value", [1, 25, 50, 75, 99])
+    def test_conditional_flow_execution(self, value):
+        """Test conditional flow with different generated numbers."""
+        with patch("random.randint", return_value=value):
             result = random_conditional_flow.run()
-            results.append(result)
 
         # Should have completed successfully
-        for result in results:
-            assert result["_flow_completed"] is True
-            assert result["_flow_steps"] >= 2  # At least start + conditional
-            assert "start" in result["_flow_path"]
-            assert "check_threshold" in result["_flow_path"]
+        assert result["random_number"] == value
+        assert result["_flow_completed"] is True
+        assert result["_flow_steps"] >= 2  # At least start + conditional
+        assert "start" in result["_flow_path"]
+        assert "check_threshold" in result["_flow_path"]
 
 
 class TestFlowErrorHandling:
     """Test flow error handling scenarios."""
 
-    class ErrorNode(BaseNode):
-        """Test node that always raises an error."""
-
-        def exec(self, store):  # noqa: ARG002
-            msg = "Test error"
-            raise RuntimeError(msg)
-
     def test_node_error_handling(self):
         """Test flow handles node execution errors."""
         flow_def = {
             "start": FlowNode(
-                node_class=self.ErrorNode,
+                node_class=ErrorNode,
                 transitions={"success": "end", "error": "end"},
             )
         }
@@ -142,11 +229,31 @@ class TestFlowErrorHandling:
         # Flow completes because there is an error transition to "end"
         assert result["_flow_completed"] is True
 
+    def test_error_handler_node_runs_after_error(self):
+        """Test that an error-handling node runs after an upstream error."""
+        flow_def = {
+            "start": FlowNode(
+                node_class=ErrorNode,
+                transitions={"success": "end", "error": "recover"},
+            ),
+            "recover": FlowNode(
+                node_class=RecoveryNode, transitions={"success": "end"}
+            ),
+        }
+        flow = BaseFlow(flow_def, name="RecoveryTestFlow")
+
+        result = flow.run()
+
+        assert result["action"] == "success"
+        assert result["recovered_from"] == "Test error"
+        assert result["_flow_path"] == ["start", "recover"]
+        assert result["_flow_completed"] is True
+
     def test_node_error_without_error_transition(self):
         """Test flow stops when node errors and no error transition exists."""
         flow_def = {
             "start": FlowNode(
-                node_class=self.ErrorNode,
+                node_class=ErrorNode,
                 transitions={"success": "end"},  # No error transition
             )
         }
@@ -157,6 +264,19 @@ class TestFlowErrorHandling:
         assert result["action"] == "error"
         assert result["_flow_completed"] is False
 
+    def test_node_without_exec(self):
+        """Test flow reports nodes that don't implement exec."""
+        flow_def = {
+            "start": FlowNode(node_class=BaseNode, transitions={"success": "end"})
+        }
+        flow = BaseFlow(flow_def, name="NoExecTestFlow")
+
+        result = flow.run()
+
+        assert result["action"] == "error"
+        assert "BaseNode.exec not implemented" in result["error"]
+        assert result["_flow_completed"] is False
+
     def test_unknown_node_error(self):
         """Test handling of transitions to unknown nodes."""
         # Create a flow that tries to transition to an unknown node
@@ -177,13 +297,6 @@ class TestFlowErrorHandling:
     def test_max_steps_exceeded(self):
         """Test flow stops when max steps exceeded."""
 
-        class LoopNode(BaseNode):
-            """Node that always returns 'loop' action."""
-
-            def exec(self, store):
-                store["action"] = "loop"
-                return store
-
         flow_def = {
             "start": FlowNode(
                 node_class=LoopNode,
@@ -195,6 +308,7 @@ class TestFlowErrorHandling:
         result = flow.run(max_steps=5)
 
         assert result["_flow_steps"] == 5
+        assert result["_flow_path"] == ["start"] * 5
         assert result["action"] == "error"
         assert "exceeded maximum steps" in result["error"]
         assert result["_flow_completed"] is False
@@ -203,18 +317,22 @@ class TestFlowErrorHandling:
 class TestFlowTransitions:
     """Test flow transition logic."""
 
-    class CustomActionNode(BaseNode):
-        """Node that returns a custom action."""
+    def test_transition_names_interned(self):
+        """Test that FlowNode interns action and target names."""
+        action = "".join(["spec", "ific"])
+        target = "".join(["specific", "_node"])
+
+        node = FlowNode(node_class=CustomActionNode, transitions={action: target})
 
-        def exec(self, store):
-            store["action"] = store.get("custom_action", "default")
-            return store
+        ((stored_action, stored_target),) = node.transitions.items()
+        assert stored_action is sys.intern("specific")
+        assert stored_target is sys.intern("specific_node")
 
     def test_default_transition(self):
         """Test flow uses default transition when action not found."""
         flow_def = {
             "start": FlowNode(
-                node_class=self.CustomActionNode,
+                node_class=CustomActionNode,
                 transitions={"default": "end", "specific": "end"},
             )
         }
@@ -229,11 +347,11 @@ class TestFlowTransitions:
         """Test flow uses specific action transition when available."""
         flow_def = {
             "start": FlowNode(
-                node_class=self.CustomActionNode,
+                node_class=CustomActionNode,
                 transitions={"default": "end", "specific": "second"},
             ),
             "second": FlowNode(
-                node_class=self.CustomActionNode,
+                node_class=CustomActionNode,
                 transitions={"default": "end", "specific": "end"},
             ),
         }
@@ -249,7 +367,7 @@ class TestFlowTransitions:
         """Test flow goes to end when no matching or default transition."""
         flow_def = {
             "start": FlowNode(
-                node_class=self.CustomActionNode,
+                node_class=CustomActionNode,
                 transitions={"specific": "end"},  # No default
             )
         }
@@ -307,6 +425,17 @@ class TestExampleFlows:
         assert "data" in result  # Data was processed
         assert result["_flow_completed"] is True
 
+    def test_data_pipeline_flow_handles_error(self, caplog):
+        """Test that a failing transform is reported by the error handler."""
+        with caplog.at_level(logging.WARNING):
+            result = data_pipeline_flow.run({"input_data": "not a list"})
+
+        assert result["action"] == "error"
+        assert result["error"] == "Field 'input_data' must be list, got str"
+        assert result["error_handled"] is True
+        assert result["_flow_path"] == ["start", "error_handler"]
+        assert "Handling error from an earlier node" in caplog.text
+
     def test_random_conditional_flow_paths(self):
         """Test random conditional flow takes different paths."""
         # Mock the random number to test specific paths
@@ -346,6 +475,10 @@ class TestFlowRobustness:
         assert "_flow_name" in result
         assert "_flow_path" in result
 
+        # Each run without a store gets a fresh one
+        assert greeting_flow.run(None) is not result
+        assert result["_flow_path"] == ["start"]
+
     def test_flow_preserves_existing_data(self):
         """Test flow preserves existing data in store."""
         initial = {"existing_key": "existing_value", "number": 42, "list": [1, 2, 3]}
@@ -357,6 +490,26 @@ class TestFlowRobustness:
         assert result["list"] == [1, 2, 3]
         assert result["_flow_completed"] is True
 
+    def test_flow_updates_store_in_place(self):
+        """Test flow returns the caller's store, even when it starts empty."""
+        initial = {}
+
+        result = greeting_flow.run(initial)
+
+        assert result is initial
+        assert initial["_flow_name"] == "GreetingFlow"
+
+    def test_flow_continues_existing_bookkeeping(self):
+        """Test flow extends the path of a store from an enclosing flow."""
+        outer = {"name": "Nested", "_flow_name": "OuterFlow", "_flow_path": ["a"]}
+
+        result = greeting_flow.run(outer)
+
+        assert result["_flow_name"] == "OuterFlow"
+        assert result["_flow_path"] == ["a", "start"]
+        assert result["_flow_steps"] == 1
+        assert result["_flow_completed"] is True
+
     def test_flow_name_default(self):
         """Test flow uses class name when no name provided."""
         flow_def = {
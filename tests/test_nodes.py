@@ -1,180 +1,163 @@
 """Tests for example nodes."""
 
-from src.app.pocketflow.nodes.examples import (
-    ConditionalNode,
-    DataTransformNode,
-    GreetingNode,
-    RandomNumberNode,
-)
+import random
 
+import pytest
 
-class TestGreetingNode:
-    """Test the GreetingNode implementation."""
+# Nodes write their results into the store they are given, so tests must pass
+# a copy of these shared inputs rather than the constants themselves.
+ALICE_STORE = {"name": "alice", "time_of_day": "morning"}
+BOB_STORE = {"name": "bob"}
 
-    def test_greeting_success(self):
-        """Test successful greeting generation."""
-        node = GreetingNode()
-        store = {"name": "alice", "time_of_day": "morning"}
 
-        result = node.run(store)
+def _assert_outcome(result, action, *, contains=None, key=None):
+    """Assert a node's action and, optionally, text in one of its outputs."""
+    assert result["action"] == action
+    if contains is not None:
+        assert contains in result[key]
 
-        assert result["action"] == "success"
-        assert result["greeting"] == "Good morning, Alice! ☀️"
-        assert result["greeting_metadata"]["personalized"] is True
-        assert result["greeting_metadata"]["time_aware"] is True
 
-    def test_greeting_default_time(self):
-        """Test greeting with default time of day."""
-        node = GreetingNode()
-        store = {"name": "bob"}
+class TestGreetingNode:
+    """Test the GreetingNode implementation."""
 
-        result = node.run(store)
+    @pytest.mark.parametrize(
+        ("store", "action", "expected"),
+        [
+            pytest.param(
+                ALICE_STORE, "success", "Good morning, Alice! ☀️", id="time_of_day"
+            ),
+            pytest.param(BOB_STORE, "success", "Hello, Bob! 👋", id="default_time"),
+            pytest.param(
+                {}, "error", "Missing required fields: name", id="missing_name"
+            ),
+            pytest.param(
+                {"name": "  jOhN dOe  "}, "success", "John Doe", id="normalized_name"
+            ),
+        ],
+    )
+    def test_greeting(self, greeting_node, store, action, expected):
+        """Test greeting generation and validation."""
+        result = greeting_node.run(store.copy())
+
+        assert result["action"] == action
+        assert expected in result.get("greeting", result.get("error", ""))
+
+    @pytest.mark.parametrize(
+        ("store", "time_aware"),
+        [
+            (ALICE_STORE, True),
+            (BOB_STORE, False),
+        ],
+        ids=["time_of_day", "default_time"],
+    )
+    def test_greeting_metadata(self, greeting_node, store, time_aware):
+        """Test the metadata recorded alongside a greeting."""
+        result = greeting_node.run(store.copy())
 
-        assert result["action"] == "success"
-        assert result["greeting"] == "Hello, Bob! 👋"
-        assert result["greeting_metadata"]["time_aware"] is False
+        assert result["greeting_metadata"]["personalized"] is True
+        assert result["greeting_metadata"]["time_aware"] is time_aware
 
-    def test_greeting_missing_name(self):
-        """Test error when name is missing."""
-        node = GreetingNode()
-        store = {}
+    def test_greeting_skips_upstream_error(self, greeting_node):
+        """Test that an error from an earlier node is passed through."""
+        store = {"name": "alice", "action": "error", "error": "Upstream failure"}
 
-        result = node.run(store)
+        result = greeting_node.run(store)
 
         assert result["action"] == "error"
-        assert "Missing required fields: name" in result["error"]
-
-    def test_greeting_name_normalization(self):
-        """Test that names are properly normalized."""
-        node = GreetingNode()
-        store = {"name": "  jOhN dOe  "}
-
-        result = node.run(store)
-
-        assert result["action"] == "success"
-        assert "John Doe" in result["greeting"]
+        assert result["error"] == "Upstream failure"
+        assert "greeting" not in result
 
 
 class TestRandomNumberNode:
     """Test the RandomNumberNode implementation."""
 
-    def test_random_number_default_range(self):
-        """Test random number with default range."""
-        node = RandomNumberNode()
-        store = {}
-
-        result = node.run(store)
-
-        assert result["action"] == "success"
-        assert "random_number" in result
-        assert 1 <= result["random_number"] <= 100
-
-    def test_random_number_custom_range(self):
-        """Test random number with custom range."""
-        node = RandomNumberNode()
-        store = {"min_value": 10, "max_value": 20}
-
-        result = node.run(store)
+    @pytest.fixture(autouse=True)
+    def _seed(self, monkeypatch):
+        """Draw numbers from a seeded generator so results are exact."""
+        monkeypatch.setattr(
+            "src.app.pocketflow.nodes.examples.random.randint",
+            random.Random(0).randint,  # noqa: S311
+        )
+
+    @pytest.mark.parametrize(
+        ("store", "expected"),
+        [
+            pytest.param({}, 50, id="default_range"),
+            pytest.param({"min_value": 10, "max_value": 20}, 16, id="custom_range"),
+        ],
+    )
+    def test_random_number(self, random_number_node, store, expected):
+        """Test the seeded number drawn for a range."""
+        result = random_number_node.run(store)
 
         assert result["action"] == "success"
-        assert 10 <= result["random_number"] <= 20
+        assert result["random_number"] == expected
 
-    def test_random_number_invalid_range(self):
+    def test_random_number_invalid_range(self, random_number_node):
         """Test error with invalid range."""
-        node = RandomNumberNode()
         store = {"min_value": 50, "max_value": 10}
 
-        result = node.run(store)
+        result = random_number_node.run(store)
 
-        assert result["action"] == "error"
-        assert "must be less than" in result["error"]
+        _assert_outcome(result, "error", contains="must be less than", key="error")
 
 
 class TestDataTransformNode:
     """Test the DataTransformNode implementation."""
 
-    def test_transform_uppercase(self):
-        """Test uppercase transformation."""
-        node = DataTransformNode()
-        store = {"input_data": ["hello", "world"], "transform_type": "uppercase"}
-
-        result = node.run(store)
-
-        assert result["action"] == "success"
-        assert result["transformed_data"] == ["HELLO", "WORLD"]
-        assert result["transform_stats"]["input_count"] == 2
-        assert result["transform_stats"]["output_count"] == 2
-
-    def test_transform_reverse(self):
-        """Test reverse transformation."""
-        node = DataTransformNode()
-        store = {"input_data": [1, 2, 3, 4, 5], "transform_type": "reverse"}
-
-        result = node.run(store)
-
-        assert result["action"] == "success"
-        assert result["transformed_data"] == [5, 4, 3, 2, 1]
-
-    def test_transform_sort(self):
-        """Test sort transformation."""
-        node = DataTransformNode()
-        store = {"input_data": [3, 1, 4, 1, 5], "transform_type": "sort"}
+    @pytest.mark.parametrize(
+        ("transform_type", "input_data", "expected"),
+        [
+            ("uppercase", ["hello", "world"], ["HELLO", "WORLD"]),
+            ("reverse", [1, 2, 3, 4, 5], [5, 4, 3, 2, 1]),
+            ("sort", [3, 1, 4, 1, 5], [1, 1, 3, 4, 5]),
+        ],
+    )
+    def test_transform(self, transform_node, transform_type, input_data, expected):
+        """Test each supported transformation."""
+        store = {"input_data": input_data, "transform_type": transform_type}
 
-        result = node.run(store)
+        result = transform_node.run(store)
 
         assert result["action"] == "success"
-        assert result["transformed_data"] == [1, 1, 3, 4, 5]
-
-    def test_transform_missing_data(self):
-        """Test error when input data is missing."""
-        node = DataTransformNode()
-        store = {}
-
-        result = node.run(store)
-
-        assert result["action"] == "error"
-        assert "Missing required fields" in result["error"]
-
-    def test_transform_invalid_type(self):
-        """Test error when input is not a list."""
-        node = DataTransformNode()
-        store = {"input_data": "not a list"}
-
-        result = node.run(store)
-
-        assert result["action"] == "error"
-        assert "must be list" in result["error"]
+        assert result["transformed_data"] == expected
+        assert result["transform_stats"]["input_count"] == len(input_data)
+        assert result["transform_stats"]["output_count"] == len(expected)
+
+    @pytest.mark.parametrize(
+        ("store", "error"),
+        [
+            pytest.param(
+                {"input_data": [1, 2, 3], "transform_type": "shuffle"},
+                "Unknown transform type: shuffle",
+                id="unknown_type",
+            ),
+            pytest.param({}, "Missing required fields", id="missing_data"),
+            pytest.param({"input_data": "not a list"}, "must be list", id="not_a_list"),
+        ],
+    )
+    def test_transform_errors(self, transform_node, store, error):
+        """Test errors for unsupported or invalid input."""
+        result = transform_node.run(store)
+
+        _assert_outcome(result, "error", contains=error, key="error")
 
 
 class TestConditionalNode:
     """Test the ConditionalNode implementation."""
 
-    def test_conditional_above_threshold(self):
-        """Test value above threshold."""
-        node = ConditionalNode()
-        store = {"value": 75, "threshold": 50}
-
-        result = node.run(store)
-
-        assert result["action"] == "above_threshold"
-        assert "above threshold" in result["message"]
-
-    def test_conditional_below_threshold(self):
-        """Test value below threshold."""
-        node = ConditionalNode()
-        store = {"value": 25, "threshold": 50}
-
-        result = node.run(store)
-
-        assert result["action"] == "below_threshold"
-        assert "below threshold" in result["message"]
-
-    def test_conditional_at_threshold(self):
-        """Test value equal to threshold."""
-        node = ConditionalNode()
-        store = {"value": 50, "threshold": 50}
-
-        result = node.run(store)
-
-        assert result["action"] == "at_threshold"
-        assert "equals threshold" in result["message"]
+    @pytest.mark.parametrize(
+        ("value", "action", "message"),
+        [
+            (75, "above_threshold", "above threshold"),
+            (25, "below_threshold", "below threshold"),
+            (50, "at_threshold", "equals threshold"),
+        ],
+    )
+    def test_conditional(self, conditional_node, value, action, message):
+        """Test branching on a value relative to the threshold."""
+        store = {"value": value, "threshold": 50}
+
+        result = conditional_node.run(store)
+
+        _assert_outcome(result, action, contains=message, key="message")